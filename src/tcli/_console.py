@@ -0,0 +1,16 @@
+"""The rich console shared by every part of tCLI."""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the shared rich console, creating it on first use."""
+    # rich is imported here so commands that print nothing skip it
+    from rich.console import Console
+
+    return Console()
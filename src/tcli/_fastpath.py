@@ -0,0 +1,15 @@
+"""Small, allocation-free helpers used on hot paths."""
+
+from datetime import datetime
+
+
+def _parse_iso(s: str) -> datetime:
+    """Parse an ISO 8601 string, accepting 'Z' for UTC wherever the old code did."""
+    # fromisoformat (3.11+) takes a "Z" after a time but not after a bare date
+    # such as "2025-01-01Z", so "Z" is only rewritten when the first parse fails
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        if "Z" not in s:
+            raise
+    return datetime.fromisoformat(s.replace("Z", "+00:00"))
@@ -1,12 +1,29 @@
 """API client for interacting with the Todo API."""
 
-from typing import Optional
+from functools import cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-import httpx
+import msgspec
 
 from tcli.models import TodoCreate, TodoRead, TodoUpdate
 
+if TYPE_CHECKING:
+    import httpx
+
+# Reusable decoders that parse and validate a response body in a single pass;
+# strict=False accepts the same lax inputs (e.g. numeric strings) pydantic did
+_TODO_LIST_DECODER = msgspec.json.Decoder(list[TodoRead], strict=False)
+_TODO_DECODER = msgspec.json.Decoder(TodoRead, strict=False)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@cache
+def _http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    return find_spec("h2") is not None
+
 
 class APIError(Exception):
     """Base exception for API errors."""
@@ -17,18 +34,56 @@ class APIError(Exception):
 class APIClient:
     """Client for interacting with the Todo API."""
 
-    def __init__(self, base_url: str, api_key: str):
-        """Initialize the API client."""
+    __slots__ = ("base_url", "api_key", "shared", "client")
+
+    def __init__(self, base_url: str, api_key: str, shared: bool = False):
+        """
+        Initialize the API client.
+
+        A shared client is not closed when its ``with`` block exits, so its
+        pooled connections can be reused; whoever shares it must call close().
+        """
+        import httpx
+
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            headers={"X-API-Key": self.api_key},
-            timeout=30.0,
-        )
+        self.shared = shared
+        self.client = httpx.Client(**self._client_options())
+
+    def _client_options(self) -> dict:
+        """Build the keyword arguments for the underlying httpx client."""
+        # httpx is imported here so commands that never hit the API skip it
+        import httpx
+
+        return {
+            "base_url": self.base_url,
+            "headers": {"X-API-Key": self.api_key},
+            "timeout": 30.0,
+            "http2": _http2_available(),
+            "limits": httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+        }
+
+    @staticmethod
+    def _list_params(
+        q: Optional[str],
+        tag: Optional[str],
+        status: Optional[str],
+        limit: Optional[int],
+    ) -> dict:
+        """Build query parameters for listing todos."""
+        params = {}
+        if q is not None:
+            params["q"] = q
+        if tag is not None:
+            params["tag"] = tag
+        if status is not None:
+            params["status"] = status
+        if limit is not None:
+            params["limit"] = limit
+        return params
 
-    def _handle_response(self, response: httpx.Response) -> dict:
-        """Handle API response and raise appropriate errors."""
+    def _check_response(self, response: "httpx.Response") -> None:
+        """Raise an appropriate APIError if the response is not a success."""
         if response.status_code == 401:
             raise APIError("Unauthorized - Missing or invalid API key")
         elif response.status_code == 403:
@@ -44,16 +99,22 @@ class APIClient:
         elif not response.is_success:
             raise APIError(f"API error: {response.status_code} - {response.text}")
 
+    def _handle_response(self, response: "httpx.Response") -> dict:
+        """Handle API response and raise appropriate errors."""
+        self._check_response(response)
+
         if response.status_code == 204:  # No content
             return {}
 
-        return response.json()
+        return msgspec.json.decode(response.content)
 
     def create_todo(self, todo: TodoCreate) -> TodoRead:
         """Create a new todo item."""
-        response = self.client.post("/todos/", json=todo.model_dump(mode='json', exclude_none=True))
-        data = self._handle_response(response)
-        return TodoRead(**data)
+        response = self.client.post(
+            "/todos/", content=msgspec.json.encode(todo), headers=_JSON_HEADERS
+        )
+        self._check_response(response)
+        return _TODO_DECODER.decode(response.content)
 
     def list_todos(
         self,
@@ -63,33 +124,24 @@ class APIClient:
         limit: Optional[int] = None,
     ) -> list[TodoRead]:
         """List todos with optional filtering."""
-        params = {}
-        if q is not None:
-            params["q"] = q
-        if tag is not None:
-            params["tag"] = tag
-        if status is not None:
-            params["status"] = status
-        if limit is not None:
-            params["limit"] = limit
-
+        params = self._list_params(q, tag, status, limit)
         response = self.client.get("/todos/", params=params)
-        data = self._handle_response(response)
-        return [TodoRead(**item) for item in data]
+        self._check_response(response)
+        return _TODO_LIST_DECODER.decode(response.content)
 
     def get_todo(self, item_id: UUID) -> TodoRead:
         """Get a todo by ID."""
         response = self.client.get(f"/todos/{item_id}")
-        data = self._handle_response(response)
-        return TodoRead(**data)
+        self._check_response(response)
+        return _TODO_DECODER.decode(response.content)
 
     def update_todo(self, item_id: UUID, todo: TodoUpdate) -> TodoRead:
         """Update a todo item."""
         response = self.client.patch(
-            f"/todos/{item_id}", json=todo.model_dump(mode='json', exclude_none=True)
+            f"/todos/{item_id}", content=msgspec.json.encode(todo), headers=_JSON_HEADERS
         )
-        data = self._handle_response(response)
-        return TodoRead(**data)
+        self._check_response(response)
+        return _TODO_DECODER.decode(response.content)
 
     def delete_todo(self, item_id: UUID) -> None:
         """Delete a todo item."""
@@ -111,5 +163,5 @@ class APIClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
-
+        if not self.shared:
+            self.close()
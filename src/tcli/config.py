@@ -1,15 +1,76 @@
 """Configuration management for tCLI."""
 
+import json
 import os
 from pathlib import Path
 from typing import Optional
 
-import yaml
+# Parsed config files, keyed by (path, mtime_ns, size) so edits invalidate them
+_CFG_CACHE: dict[tuple, dict] = {}
+
+# Marks a JSON sidecar as written by tCLI; files without it are never replaced
+_SIDECAR_FORMAT = "tcli-config-cache/1"
+
+
+def _yaml_codecs():
+    """Import PyYAML on demand, preferring the libyaml C bindings."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+    return yaml, SafeLoader, SafeDumper
+
+
+def _sidecar_path(config_path: Path) -> Path:
+    """Get the hidden file the parsed copy of config_path is cached in."""
+    return config_path.with_name(f".{config_path.name}.cache.json")
+
+
+def _read_sidecar(cache_path: Path) -> Optional[dict]:
+    """
+    Load the JSON sidecar written by tCLI.
+
+    Returns {} if there is no sidecar yet, and None if the file at cache_path
+    was not written by tCLI (or cannot be read), so it must be left alone.
+    """
+    try:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("format") != _SIDECAR_FORMAT:
+        return None
+    return cached
+
+
+def _write_sidecar(cache_path: Path, source: list, config_data: dict) -> None:
+    """Write parsed config to a JSON sidecar, ignoring any failure."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        # The copy holds the API key, so only the owner may read it
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "w") as f:
+            json.dump({"format": _SIDECAR_FORMAT, "source": source, "data": config_data}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # The sidecar is only an optimization; YAML stays the source of truth
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
 
 class Config:
     """Manages configuration from file and environment variables."""
 
+    __slots__ = ("config_path", "base_url", "api_key")
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize config, loading from file and environment variables."""
         self.config_path = config_path or self._get_default_config_path()
@@ -30,16 +91,25 @@ class Config:
 
         return config_dir / "config.yaml"
 
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget all parsed config files so the next load re-reads them."""
+        _CFG_CACHE.clear()
+
     def _load_config(self) -> None:
         """Load configuration from file and environment variables."""
         # Load from file if it exists
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r") as f:
-                    config_data = yaml.safe_load(f) or {}
-                    api_config = config_data.get("api", {})
-                    self.base_url = api_config.get("base_url", "")
-                    self.api_key = api_config.get("api_key", "")
+                st = self.config_path.stat()
+                key = (str(self.config_path), st.st_mtime_ns, st.st_size)
+                config_data = _CFG_CACHE.get(key)
+                if config_data is None:
+                    config_data = self._read_config_file(st)
+                    _CFG_CACHE[key] = config_data
+                api_config = config_data.get("api", {})
+                self.base_url = api_config.get("base_url", "")
+                self.api_key = api_config.get("api_key", "")
             except Exception as e:
                 print(f"Warning: Could not load config file: {e}")
 
@@ -59,6 +129,24 @@ class Config:
                 f"or create config file at {self.config_path}"
             )
 
+    def _read_config_file(self, st: os.stat_result) -> dict:
+        """Read the config file, using the JSON sidecar when it is up to date."""
+        # The sidecar records the YAML's mtime and size it was generated from
+        cache_path = _sidecar_path(self.config_path)
+        source = [st.st_mtime_ns, st.st_size]
+        cached = _read_sidecar(cache_path)
+        if cached and cached.get("source") == source and isinstance(cached.get("data"), dict):
+            return cached["data"]
+
+        yaml, SafeLoader, _ = _yaml_codecs()
+        with open(self.config_path, "r") as f:
+            config_data = yaml.load(f, Loader=SafeLoader) or {}
+
+        # Only create or refresh a sidecar this code owns
+        if cached is not None:
+            _write_sidecar(cache_path, source, config_data)
+        return config_data
+
     def create_default_config(self, base_url: str, api_key: str) -> None:
         """Create a default config file with the provided values."""
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -68,7 +156,8 @@ class Config:
                 "api_key": api_key,
             }
         }
+        yaml, _, SafeDumper = _yaml_codecs()
         with open(self.config_path, "w") as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+            yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False)
         print(f"Configuration saved to {self.config_path}")
 
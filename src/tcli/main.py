@@ -1,24 +1,40 @@
 """Main CLI entry point for tCLI."""
 
+import atexit
+import errno
+import os
+import re
 import sys
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 import typer
-from rich.console import Console
 
-from tcli.api import APIError, APIClient
+from tcli._console import get_console
+from tcli._fastpath import _parse_iso
 from tcli.config import Config
-from tcli.models import TodoCreate, TodoRead, TodoUpdate
-from tcli.output import print_json, print_todo_detail, print_todo_table
 
-app = typer.Typer(help="CLI tool for managing todos via the Todo API")
-console = Console()
+if TYPE_CHECKING:
+    from tcli.api import APIClient
+    from tcli.models import TodoRead
 
 # Known commands that should not be treated as todo titles
-KNOWN_COMMANDS = {"list", "update", "delete", "get", "add", "edit", "done"}
+KNOWN_COMMANDS = frozenset({"list", "update", "delete", "get", "add", "edit", "done"})
+
+# Fuzzy name matching: minimum rapidfuzz WRatio score (0-100) and maximum matches shown
+FUZZY_SCORE_CUTOFF = 60
+FUZZY_MATCH_LIMIT = 25
+
+# US date format accepted by parse_date (MM/DD/YYYY or MM-DD-YYYY, one separator
+# used twice), compiled once at import
+_US_DATE_RE = re.compile(r"(\d{1,2})([/-])(\d{1,2})\2(\d{4})$")
+
+# Splits a comma-separated --tags value and strips each tag in one pass;
+# callers strip the ends of the whole string first
+_TAG_SPLIT = re.compile(r"\s*,\s*").split
 
 
 def parse_date(date_str: str) -> datetime:
@@ -32,112 +48,80 @@ def parse_date(date_str: str) -> datetime:
     - ISO format with Z: 2025-01-01T00:00:00Z
     
     If only a date is provided (no time), defaults to midnight (00:00:00).
+    The input is classified up front so exactly one parser runs per call.
     """
     date_str = date_str.strip()
     
-    # Try ISO format with time first (handles full ISO and Z suffix)
+    # Only out-of-range values (e.g. month 13) raise here; try has no cost otherwise
     try:
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        # Input starting with a 4-digit year can only be ISO (date-only or with
+        # time); fromisoformat decides whether the rest is valid
+        if date_str[:4].isdigit():
+            return _parse_iso(date_str)
+        
+        # US format with slash or dash (MM/DD/YYYY, MM-DD-YYYY)
+        match = _US_DATE_RE.match(date_str)
+        if match:
+            month, _, day, year = match.groups()
+            return datetime(int(year), int(month), int(day))
     except ValueError:
         pass
     
-    # Try ISO format date-only (YYYY-MM-DD)
-    # Check if it looks like ISO format (starts with 4 digits)
-    if len(date_str) == 10 and date_str.count("-") == 2 and date_str[0:4].isdigit():
-        try:
-            return datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            pass
-    
-    # Try US format with slash (MM/DD/YYYY)
-    if "/" in date_str:
-        parts = date_str.split("/")
-        if len(parts) == 3:
-            try:
-                return datetime.strptime(date_str, "%m/%d/%Y")
-            except ValueError:
-                pass
-    
-    # Try US format with dash (MM-DD-YYYY)
-    # Only if it doesn't look like ISO format (doesn't start with 4 digits)
-    if "-" in date_str and len(date_str) == 10 and not date_str[0:4].isdigit():
-        try:
-            return datetime.strptime(date_str, "%m-%d-%Y")
-        except ValueError:
-            pass
-    
-    # If all parsing attempts fail, raise an error
     raise ValueError(
         f"Invalid date format: {date_str}. "
         f"Supported formats: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, MM/DD/YYYY, MM-DD-YYYY"
     )
 
 
-def get_client(config_path: Optional[Path] = None) -> APIClient:
-    """Get an API client instance."""
-    try:
-        config = Config(config_path)
-        return APIClient(config.base_url, config.api_key)
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+# Every shared client created so far, closed together when the process exits
+_OPEN_CLIENTS: "list[APIClient]" = []
 
 
-def _calculate_fuzzy_score(search_term: str, title: str) -> float:
-    """
-    Calculate a fuzzy matching score between search term and title.
-    Returns a score from 0.0 to 100.0, with higher scores indicating better matches.
+@lru_cache(maxsize=4)
+def _shared_client(base_url: str, api_key: str) -> "APIClient":
+    """Create the shared API client for one server and key."""
+    from tcli.api import APIClient
+
+    client = APIClient(base_url, api_key, shared=True)
+    _OPEN_CLIENTS.append(client)
+    return client
+
+
+def _close_all_clients() -> None:
+    """Close every shared API client."""
+    _shared_client.cache_clear()
+    while _OPEN_CLIENTS:
+        _OPEN_CLIENTS.pop().close()
+
+
+atexit.register(_close_all_clients)
+
+
+def get_client(config_path: Optional[Path] = None) -> "APIClient":
     """
-    search_lower = search_term.lower().strip()
-    title_lower = title.lower().strip()
-    
-    # Exact match (case-insensitive)
-    if search_lower == title_lower:
-        return 100.0
-    
-    # Starts with match
-    if title_lower.startswith(search_lower):
-        return 90.0
+    Get the API client for the configured server.
     
-    # Contains match
-    if search_lower in title_lower:
-        return 80.0
-    
-    # Word-based matching: check if all words in search appear in title
-    search_words = [w for w in search_lower.split() if w]
-    title_words = [w for w in title_lower.split() if w]
-    
-    if search_words:
-        matching_words = sum(1 for word in search_words if word in title_words)
-        word_match_ratio = matching_words / len(search_words)
-        
-        # If all words match, give high score
-        if word_match_ratio == 1.0:
-            return 70.0
-        
-        # Partial word match
-        if word_match_ratio > 0.5:
-            return 50.0 + (word_match_ratio - 0.5) * 40.0
-    
-    # Character-based similarity (only as last resort, with strict threshold)
-    # Ignore spaces and count unique characters
-    search_chars = set(search_lower.replace(" ", ""))
-    title_chars = set(title_lower.replace(" ", ""))
-    common_chars = search_chars & title_chars
-    
-    if search_chars and len(search_chars) >= 3:  # Only use for longer search terms
-        char_ratio = len(common_chars) / len(search_chars)
-        # Require at least 70% character match to get any score
-        if char_ratio >= 0.7:
-            return char_ratio * 40.0
-    
-    return 0.0
+    Clients are shared per (base_url, api_key) so follow-up requests in the
+    same process reuse their open connections, even when different config
+    files point at the same server; they are closed when the process exits.
+    """
+    config = _load_config(config_path)
+    return _shared_client(config.base_url, config.api_key)
+
+
+def _load_config(config_path: Optional[Path] = None) -> Config:
+    """Load the config, exiting with an error if it is incomplete."""
+    try:
+        return Config(config_path)
+    except ValueError as e:
+        get_console().print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
 
 def _resolve_task_identifier(
     identifier: str,
-    client: APIClient,
-) -> TodoRead:
+    client: "APIClient",
+) -> "TodoRead":
     """
     Resolve a task identifier (UUID or name) to a TodoRead object.
     
@@ -147,6 +131,9 @@ def _resolve_task_identifier(
     
     When multiple tasks match a name, displays them and prompts for selection.
     """
+    from tcli.api import APIError
+    from tcli.output import print_todo_table
+
     # Try to parse as UUID first
     try:
         todo_id = UUID(identifier)
@@ -155,40 +142,55 @@ def _resolve_task_identifier(
         # Not a UUID, treat as name and do fuzzy matching
         pass
     
-    # Fetch all todos for fuzzy matching
+    # Let the API narrow the search first; only fall back to fuzzy matching
+    # over every todo when its title search finds nothing
     try:
-        all_todos = client.list_todos(q=None, tag=None, status=None, limit=1000)
+        quick_todos = client.list_todos(q=identifier, tag=None, status=None, limit=50)
+        if len(quick_todos) == 1:
+            return quick_todos[0]
+        all_todos = quick_todos or client.list_todos(q=None, tag=None, status=None, limit=1000)
     except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
     
     if not all_todos:
-        console.print(f"[red]Error:[/red] No todos found in the system.")
+        get_console().print(f"[red]Error:[/red] No todos found in the system.")
         sys.exit(1)
     
-    # Calculate fuzzy scores for all todos
-    scored_todos = [
-        (todo, _calculate_fuzzy_score(identifier, todo.title))
+    from rapidfuzz import fuzz, process, utils
+
+    # Only rank titles containing the search phrase or one of its words; the
+    # whole list is ranked only when nothing contains them (e.g. typos)
+    search_lower = identifier.lower().strip()
+    search_words = search_lower.split()
+    candidates = [
+        todo
         for todo in all_todos
-    ]
-    
-    # Filter out todos with low scores and sort by score (descending)
-    # Only show matches with score >= 25.0 to avoid too many false positives
-    MIN_SCORE_THRESHOLD = 25.0
-    scored_todos = [(todo, score) for todo, score in scored_todos if score >= MIN_SCORE_THRESHOLD]
-    scored_todos.sort(key=lambda x: x[1], reverse=True)
+        if search_lower in todo.title_lower
+        or any(word in todo.title_lower for word in search_words)
+    ] or all_todos
+    
+    # Rank with rapidfuzz, best match first, dropping weak matches
+    matches = process.extract(
+        identifier,
+        [todo.title for todo in candidates],
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+        score_cutoff=FUZZY_SCORE_CUTOFF,
+        limit=FUZZY_MATCH_LIMIT,
+    )
+    matching_todos = [candidates[index] for _title, _score, index in matches]
     
-    if not scored_todos:
-        console.print(f"[red]Error:[/red] No todos found matching '{identifier}'")
+    if not matching_todos:
+        get_console().print(f"[red]Error:[/red] No todos found matching '{identifier}'")
         sys.exit(1)
     
     # If only one match, return it
-    if len(scored_todos) == 1:
-        return scored_todos[0][0]
+    if len(matching_todos) == 1:
+        return matching_todos[0]
     
     # Multiple matches - show table and prompt for selection
-    matching_todos = [todo for todo, score in scored_todos]
-    console.print(f"\n[yellow]Multiple tasks found matching '{identifier}':[/yellow]")
+    get_console().print(f"\n[yellow]Multiple tasks found matching '{identifier}':[/yellow]")
     print_todo_table(matching_todos)
     
     # Prompt for selection
@@ -201,7 +203,7 @@ def _resolve_task_identifier(
             ).strip()
             
             if not selection:
-                console.print("[red]Error:[/red] Selection cannot be empty.")
+                get_console().print("[red]Error:[/red] Selection cannot be empty.")
                 continue
             
             # Try to parse as UUID
@@ -211,7 +213,7 @@ def _resolve_task_identifier(
                 for todo in matching_todos:
                     if todo.id == selected_id:
                         return todo
-                console.print(f"[red]Error:[/red] Task with ID {selection} not found in the matches above.")
+                get_console().print(f"[red]Error:[/red] Task with ID {selection} not found in the matches above.")
                 continue
             except ValueError:
                 # Not a UUID, try as index
@@ -223,25 +225,38 @@ def _resolve_task_identifier(
                 if 1 <= index <= len(matching_todos):
                     return matching_todos[index - 1]
                 else:
-                    console.print(
+                    get_console().print(
                         f"[red]Error:[/red] Index must be between 1 and {len(matching_todos)}"
                     )
                     continue
             except ValueError:
-                console.print(
+                get_console().print(
                     "[red]Error:[/red] Invalid input. Enter a valid UUID or index number."
                 )
                 continue
                 
         except (KeyboardInterrupt, EOFError):
-            console.print("\n[yellow]Selection cancelled.[/yellow]")
+            get_console().print("\n[yellow]Selection cancelled.[/yellow]")
             sys.exit(1)
     
     # If we get here, max attempts reached
-    console.print(f"[red]Error:[/red] Maximum selection attempts reached.")
+    get_console().print(f"[red]Error:[/red] Maximum selection attempts reached.")
     sys.exit(1)
 
 
+def _resolve_task_id(identifier: str, client: "APIClient") -> UUID:
+    """
+    Resolve a task identifier (UUID or name) to a todo ID.
+    
+    A UUID is used as-is, so the follow-up request doubles as the existence
+    check instead of fetching the todo first; names go through fuzzy matching.
+    """
+    try:
+        return UUID(identifier)
+    except ValueError:
+        return _resolve_task_identifier(identifier, client).id
+
+
 def _create_todo(
     title: str,
     description: Optional[str] = None,
@@ -254,8 +269,12 @@ def _create_todo(
     config_path: Optional[Path] = None,
 ):
     """Internal function to create a todo."""
+    from tcli.api import APIError
+    from tcli.models import TodoCreate
+    from tcli.output import print_json, print_todo_detail
+
     # Parse tags
-    tag_list = [tag.strip() for tag in tags.split(",")] if tags else []
+    tag_list = _TAG_SPLIT(tags.strip()) if tags else []
     
     # Add 'work' tag if --work flag is present
     if work:
@@ -271,7 +290,7 @@ def _create_todo(
         try:
             due_at_dt = parse_date(due_at)
         except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
+            get_console().print(f"[red]Error:[/red] {e}")
             sys.exit(1)
 
     # Build TodoCreate, always include priority (default to 3 if not provided)
@@ -292,120 +311,133 @@ def _create_todo(
             if json_output:
                 print_json(todo)
             else:
-                console.print("[green]✓[/green] Todo created successfully!")
+                get_console().print("[green]✓[/green] Todo created successfully!")
                 print_todo_detail(todo)
     except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
-@app.command()
-def add(
-    title: str = typer.Argument(..., help="Todo title"),
-    description: Optional[str] = typer.Option(None, "--description", "-d", help="Description of the todo"),
-    due_at: Optional[str] = typer.Option(None, "--due-at", help="Due date (supports: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, MM/DD/YYYY)"),
-    priority: Optional[int] = typer.Option(None, "--priority", "-p", help="Priority (1=highest, 5=lowest, default=3)"),
-    tags: Optional[str] = typer.Option(None, "--tags", help="Comma-separated list of tags"),
-    estimated_minutes: Optional[int] = typer.Option(None, "--estimated-minutes", "-e", help="Estimated minutes"),
-    work: bool = typer.Option(False, "--work", help="Add 'work' tag to the todo"),
-    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
-    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+def _list_todos(
+    q: Optional[str] = None,
+    tag: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    json_output: bool = False,
+    config_path: Optional[Path] = None,
 ):
-    """Add a new todo item. Default priority is 3 and default status is 'todo'."""
-    _create_todo(
-        title=title,
-        description=description,
-        due_at=due_at,
-        priority=priority,
-        tags=tags,
-        estimated_minutes=estimated_minutes,
-        work=work,
-        json_output=json_output,
-        config_path=config_path,
-    )
+    """Internal function to list todos."""
+    from tcli.api import APIError
+    from tcli.output import print_json, print_todo_table
 
+    try:
+        with get_client(config_path) as client:
+            todos = client.list_todos(q=q, tag=tag, status=status, limit=limit)
+        # If status is not explicitly provided, leave out "done" in any casing;
+        # todos with no status or a custom one stay listed
+        if status is None:
+            todos = [todo for todo in todos if todo.status_lower != "done"]
+
+        if json_output:
+            print_json(todos)
+        elif not print_todo_table(todos):
+            get_console().print("[yellow]No todos found.[/yellow]")
+    except APIError as e:
+        get_console().print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
-@app.command()
-def list(
-    q: Optional[str] = typer.Option(None, "--q", help="Search query to filter by title"),
-    tag: Optional[str] = typer.Option(None, "--tag", help="Filter by tag"),
-    status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status"),
-    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Maximum number of todos to return"),
-    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
-    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+
+def _get_todo(
+    item_id: UUID,
+    json_output: bool = False,
+    config_path: Optional[Path] = None,
 ):
-    """List todos with optional filtering. By default excludes todos with status 'done'."""
+    """Internal function to show a todo by ID."""
+    from tcli.api import APIError
+    from tcli.output import print_json, print_todo_detail
+
     try:
         with get_client(config_path) as client:
-            # If status is not explicitly provided, fetch all and filter out "done"
-            if status is None:
-                todos = client.list_todos(q=q, tag=tag, status=None, limit=limit)
-                # Filter out todos with status "done"
-                todos = [todo for todo in todos if (getattr(todo, "status") or "").lower() != "done"]
-            else:
-                todos = client.list_todos(q=q, tag=tag, status=status, limit=limit)
-            
+            todo = client.get_todo(item_id)
             if json_output:
-                print_json(todos)
+                print_json(todo)
             else:
-                if not todos:
-                    console.print("[yellow]No todos found.[/yellow]")
-                else:
-                    print_todo_table(todos)
+                print_todo_detail(todo)
     except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
-@app.command()
-def get(
-    item_id: str = typer.Argument(..., help="Todo ID (UUID)"),
-    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
-    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+def _mark_done(
+    item_id: str,
+    json_output: bool = False,
+    config_path: Optional[Path] = None,
 ):
-    """Get a todo by ID."""
-    try:
-        todo_id = UUID(item_id)
-    except ValueError:
-        console.print(f"[red]Error:[/red] Invalid UUID format: {item_id}")
-        sys.exit(1)
+    """Internal function to mark a todo as done."""
+    from tcli.api import APIError
+    from tcli.models import TodoUpdate
+    from tcli.output import print_json, print_todo_detail
+
+    todo_update = TodoUpdate(status="done")
 
     try:
         with get_client(config_path) as client:
-            todo = client.get_todo(todo_id)
+            # Resolve task identifier (UUID or name with fuzzy matching)
+            todo_id = _resolve_task_id(item_id, client)
+            todo = client.update_todo(todo_id, todo_update)
             if json_output:
                 print_json(todo)
             else:
+                get_console().print("[green]✓[/green] Todo marked as done!")
                 print_todo_detail(todo)
     except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
-@app.command()
-def update(
-    item_id: str = typer.Argument(..., help="Todo ID (UUID)"),
-    title: Optional[str] = typer.Option(None, "--title", "-t", help="Title of the todo"),
-    description: Optional[str] = typer.Option(None, "--description", "-d", help="Description of the todo"),
-    due_at: Optional[str] = typer.Option(None, "--due-at", help="Due date (supports: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, MM/DD/YYYY)"),
-    status: Optional[str] = typer.Option(None, "--status", "-s", help="Status (todo, in_progress, done)"),
-    priority: Optional[int] = typer.Option(None, "--priority", "-p", help="Priority (1=highest, 5=lowest)"),
-    tags: Optional[str] = typer.Option(None, "--tags", help="Comma-separated list of tags"),
-    estimated_minutes: Optional[int] = typer.Option(None, "--estimated-minutes", "-e", help="Estimated minutes"),
-    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
-    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+def _delete_todo(
+    item_id: str,
+    config_path: Optional[Path] = None,
 ):
-    """Update a todo item."""
+    """Internal function to delete a todo."""
+    from tcli.api import APIError
+
     try:
-        todo_id = UUID(item_id)
-    except ValueError:
-        console.print(f"[red]Error:[/red] Invalid UUID format: {item_id}")
+        with get_client(config_path) as client:
+            # Resolve task identifier (UUID or name with fuzzy matching)
+            todo_id = _resolve_task_id(item_id, client)
+            client.delete_todo(todo_id)
+            get_console().print("[green]✓[/green] Todo deleted successfully!")
+    except APIError as e:
+        get_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
+
+def _apply_update(
+    item_id: "str | UUID",
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    due_at: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[int] = None,
+    tags: Optional[str] = None,
+    estimated_minutes: Optional[int] = None,
+    json_output: bool = False,
+    config_path: Optional[Path] = None,
+):
+    """
+    Internal function to update a todo.
+
+    A string item_id may also be a todo name, resolved with fuzzy matching.
+    """
+    from tcli.api import APIError
+    from tcli.models import TodoUpdate
+    from tcli.output import print_json, print_todo_detail
+
     # Parse tags
     tag_list = None
     if tags is not None:
-        tag_list = [tag.strip() for tag in tags.split(",")] if tags else None
+        tag_list = _TAG_SPLIT(tags.strip()) if tags else None
 
     # Parse due_at
     due_at_dt = None
@@ -413,7 +445,7 @@ def update(
         try:
             due_at_dt = parse_date(due_at)
         except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
+            get_console().print(f"[red]Error:[/red] {e}")
             sys.exit(1)
 
     todo_update = TodoUpdate(
@@ -428,23 +460,108 @@ def update(
 
     # Check if at least one field is provided
     if not any([title, description, due_at, status, priority, tags, estimated_minutes]):
-        console.print("[yellow]Warning:[/yellow] No fields to update. Provide at least one field.")
+        get_console().print("[yellow]Warning:[/yellow] No fields to update. Provide at least one field.")
         sys.exit(1)
 
     try:
         with get_client(config_path) as client:
+            if isinstance(item_id, UUID):
+                todo_id = item_id
+            else:
+                # Resolve task identifier (UUID or name with fuzzy matching)
+                todo_id = _resolve_task_id(item_id, client)
             todo = client.update_todo(todo_id, todo_update)
             if json_output:
                 print_json(todo)
             else:
-                console.print("[green]✓[/green] Todo updated successfully!")
+                get_console().print("[green]✓[/green] Todo updated successfully!")
                 print_todo_detail(todo)
     except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        get_console().print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
-@app.command()
+# Typer commands, registered on the app by _app()
+def add(
+    title: str = typer.Argument(..., help="Todo title"),
+    description: Optional[str] = typer.Option(None, "--description", "-d", help="Description of the todo"),
+    due_at: Optional[str] = typer.Option(None, "--due-at", help="Due date (supports: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, MM/DD/YYYY)"),
+    priority: Optional[int] = typer.Option(None, "--priority", "-p", help="Priority (1=highest, 5=lowest, default=3)"),
+    tags: Optional[str] = typer.Option(None, "--tags", help="Comma-separated list of tags"),
+    estimated_minutes: Optional[int] = typer.Option(None, "--estimated-minutes", "-e", help="Estimated minutes"),
+    work: bool = typer.Option(False, "--work", help="Add 'work' tag to the todo"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+):
+    """Add a new todo item. Default priority is 3 and default status is 'todo'."""
+    _create_todo(
+        title=title,
+        description=description,
+        due_at=due_at,
+        priority=priority,
+        tags=tags,
+        estimated_minutes=estimated_minutes,
+        work=work,
+        json_output=json_output,
+        config_path=config_path,
+    )
+
+
+def list(
+    q: Optional[str] = typer.Option(None, "--q", help="Search query to filter by title"),
+    tag: Optional[str] = typer.Option(None, "--tag", help="Filter by tag"),
+    status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status"),
+    limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Maximum number of todos to return"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+):
+    """List todos with optional filtering. By default excludes todos with status 'done'."""
+    _list_todos(
+        q=q,
+        tag=tag,
+        status=status,
+        limit=limit,
+        json_output=json_output,
+        config_path=config_path,
+    )
+
+
+def get(
+    item_id: UUID = typer.Argument(..., help="Todo ID (UUID)"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+):
+    """Get a todo by ID."""
+    _get_todo(item_id=item_id, json_output=json_output, config_path=config_path)
+
+
+def update(
+    item_id: UUID = typer.Argument(..., help="Todo ID (UUID)"),
+    title: Optional[str] = typer.Option(None, "--title", "-t", help="Title of the todo"),
+    description: Optional[str] = typer.Option(None, "--description", "-d", help="Description of the todo"),
+    due_at: Optional[str] = typer.Option(None, "--due-at", help="Due date (supports: YYYY-MM-DD, YYYY-MM-DDTHH:MM:SS, MM/DD/YYYY)"),
+    status: Optional[str] = typer.Option(None, "--status", "-s", help="Status (todo, in_progress, done)"),
+    priority: Optional[int] = typer.Option(None, "--priority", "-p", help="Priority (1=highest, 5=lowest)"),
+    tags: Optional[str] = typer.Option(None, "--tags", help="Comma-separated list of tags"),
+    estimated_minutes: Optional[int] = typer.Option(None, "--estimated-minutes", "-e", help="Estimated minutes"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
+):
+    """Update a todo item."""
+    _apply_update(
+        item_id=item_id,
+        title=title,
+        description=description,
+        due_at=due_at,
+        status=status,
+        priority=priority,
+        tags=tags,
+        estimated_minutes=estimated_minutes,
+        json_output=json_output,
+        config_path=config_path,
+    )
+
+
 def edit(
     item_id: str = typer.Argument(..., help="Todo ID (UUID) or name (supports fuzzy matching)"),
     title: Optional[str] = typer.Option(None, "--title", "-t", help="Title of the todo"),
@@ -458,91 +575,194 @@ def edit(
     config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
 ):
     """Edit a todo item (alias for update)."""
-    # Parse tags
-    tag_list = None
-    if tags is not None:
-        tag_list = [tag.strip() for tag in tags.split(",")] if tags else None
-
-    # Parse due_at
-    due_at_dt = None
-    if due_at:
-        try:
-            due_at_dt = parse_date(due_at)
-        except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            sys.exit(1)
-
-    todo_update = TodoUpdate(
+    _apply_update(
+        item_id=item_id,
         title=title,
         description=description,
-        due_at=due_at_dt,
+        due_at=due_at,
         status=status,
         priority=priority,
-        tags=tag_list,
+        tags=tags,
         estimated_minutes=estimated_minutes,
+        json_output=json_output,
+        config_path=config_path,
     )
 
-    # Check if at least one field is provided
-    if not any([title, description, due_at, status, priority, tags, estimated_minutes]):
-        console.print("[yellow]Warning:[/yellow] No fields to update. Provide at least one field.")
-        sys.exit(1)
-
-    try:
-        with get_client(config_path) as client:
-            # Resolve task identifier (UUID or name with fuzzy matching)
-            todo = _resolve_task_identifier(item_id, client)
-            todo = client.update_todo(todo.id, todo_update)
-            if json_output:
-                print_json(todo)
-            else:
-                console.print("[green]✓[/green] Todo updated successfully!")
-                print_todo_detail(todo)
-    except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
-
 
-@app.command()
 def done(
     item_id: str = typer.Argument(..., help="Todo ID (UUID) or name (supports fuzzy matching)"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
 ):
     """Mark a todo as done."""
-    todo_update = TodoUpdate(status="done")
-
-    try:
-        with get_client(config_path) as client:
-            # Resolve task identifier (UUID or name with fuzzy matching)
-            todo = _resolve_task_identifier(item_id, client)
-            todo = client.update_todo(todo.id, todo_update)
-            if json_output:
-                print_json(todo)
-            else:
-                console.print("[green]✓[/green] Todo marked as done!")
-                print_todo_detail(todo)
-    except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+    _mark_done(item_id=item_id, json_output=json_output, config_path=config_path)
 
 
-@app.command()
 def delete(
     item_id: str = typer.Argument(..., help="Todo ID (UUID) or name (supports fuzzy matching)"),
     config_path: Optional[Path] = typer.Option(None, "--config", help="Path to config file"),
 ):
     """Delete a todo item."""
+    _delete_todo(item_id=item_id, config_path=config_path)
+
+
+@cache
+def _app() -> typer.Typer:
+    """Build the Typer app on first use, so the fast paths never construct it."""
+    app = typer.Typer(help="CLI tool for managing todos via the Todo API")
+    for command in (add, list, get, update, edit, done, delete):
+        app.command()(command)
+    return app
+
+
+def _parse_fast_args(
+    args: "list[str]",
+    options: dict,
+    positionals: int,
+) -> Optional[tuple["list[str]", dict]]:
+    """
+    Parse a command's arguments for a fast path, without Typer.
+    
+    options maps each option name to (parameter name, converter), with a None
+    converter for boolean flags. Returns the positional arguments and keyword
+    arguments, or None for anything unexpected (unknown options such as --help,
+    bad values, wrong argument count) so the caller can defer to Typer.
+    """
+    values = {}
+    arguments = []
+    index = 0
+    while index < len(args):
+        arg = args[index]
+        index += 1
+        if arg == "-" or not arg.startswith("-"):
+            arguments.append(arg)
+            continue
+        
+        name, has_value, value = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        if name not in options:
+            return None
+        dest, convert = options[name]
+        if convert is None:
+            if has_value:
+                return None
+            values[dest] = True
+            continue
+        if not has_value:
+            if index == len(args):
+                return None
+            value = args[index]
+            index += 1
+        try:
+            values[dest] = convert(value)
+        except ValueError:
+            return None
+    
+    if len(arguments) != positionals:
+        return None
+    return arguments, values
+
+
+# Options understood by the fast paths: name -> (parameter, converter or None for flags)
+_JSON_OPTION = {"--json": ("json_output", None)}
+_CONFIG_OPTION = {"--config": ("config_path", Path)}
+_FAST_LIST_OPTIONS = {
+    "--q": ("q", str),
+    "--tag": ("tag", str),
+    "--status": ("status", str),
+    "-s": ("status", str),
+    "--limit": ("limit", int),
+    "-l": ("limit", int),
+    **_JSON_OPTION,
+    **_CONFIG_OPTION,
+}
+
+
+def _fast_add(args: "list[str]") -> bool:
+    """Handle 'add <title>' with no options; anything more needs Typer's validation."""
+    parsed = _parse_fast_args(args, {}, 1)
+    if parsed is None:
+        return False
+    _create_todo(title=parsed[0][0])
+    return True
+
+
+def _fast_list(args: "list[str]") -> bool:
+    """Handle 'list [options]' without Typer."""
+    parsed = _parse_fast_args(args, _FAST_LIST_OPTIONS, 0)
+    if parsed is None:
+        return False
+    _list_todos(**parsed[1])
+    return True
+
+
+def _fast_get(args: "list[str]") -> bool:
+    """Handle 'get <id> [--json] [--config PATH]' without Typer."""
+    parsed = _parse_fast_args(args, {**_JSON_OPTION, **_CONFIG_OPTION}, 1)
+    if parsed is None:
+        return False
     try:
-        with get_client(config_path) as client:
-            # Resolve task identifier (UUID or name with fuzzy matching)
-            todo = _resolve_task_identifier(item_id, client)
-            client.delete_todo(todo.id)
-            console.print("[green]✓[/green] Todo deleted successfully!")
-    except APIError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+        item_id = UUID(parsed[0][0])
+    except ValueError:
+        # Typer reports the invalid ID when it converts the argument
+        return False
+    _get_todo(item_id, **parsed[1])
+    return True
+
+
+def _fast_done(args: "list[str]") -> bool:
+    """Handle 'done <id or name> [--json] [--config PATH]' without Typer."""
+    parsed = _parse_fast_args(args, {**_JSON_OPTION, **_CONFIG_OPTION}, 1)
+    if parsed is None:
+        return False
+    _mark_done(parsed[0][0], **parsed[1])
+    return True
+
+
+def _fast_delete(args: "list[str]") -> bool:
+    """Handle 'delete <id or name> [--config PATH]' without Typer."""
+    parsed = _parse_fast_args(args, _CONFIG_OPTION, 1)
+    if parsed is None:
+        return False
+    _delete_todo(parsed[0][0], **parsed[1])
+    return True
 
 
+# Commands with simple arguments, parsed by hand; each returns False to defer to Typer
+FAST_COMMANDS = {
+    "add": _fast_add,
+    "list": _fast_list,
+    "get": _fast_get,
+    "done": _fast_done,
+    "delete": _fast_delete,
+}
+
+
+def _run_fast_command(command, args: "list[str]") -> bool:
+    """
+    Run a fast-path handler with the error handling Typer gives its commands.
+
+    An aborted prompt prints "Aborted." and exits 1, and a stdout pipe closed
+    early (e.g. 'tcli list --json | head') exits quietly, as under Click.
+    """
+    try:
+        try:
+            return command(args)
+        except EOFError:
+            print(file=sys.stderr)
+            raise typer.Abort() from None
+    except typer.Abort:
+        from rich.console import Console
+
+        Console(stderr=True).print("Aborted.", style="red")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    except OSError as e:
+        if e.errno != errno.EPIPE:
+            raise
+        # Point stdout at devnull so the interpreter's final flush cannot fail again
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
 
 
 def main():
@@ -552,32 +772,36 @@ def main():
     
     # If no arguments, list todos
     if not args:
+        from tcli.api import APIError
+        from tcli.output import print_todo_table
+
         try:
             with get_client(None) as client:
                 todos = client.list_todos(q=None, tag=None, status=None, limit=None)
-                # Filter out todos with status "done"
-                todos = [todo for todo in todos if (getattr(todo, "status") or "").lower() != "done"]
-                
-                if not todos:
-                    console.print("[yellow]No todos found.[/yellow]")
-                else:
-                    print_todo_table(todos)
         except APIError as e:
-            console.print(f"[red]Error:[/red] {e}")
+            get_console().print(f"[red]Error:[/red] {e}")
             sys.exit(1)
+        # "done" is dropped in any casing; todos with no status or a custom one stay listed
+        if not print_todo_table(todo for todo in todos if todo.status_lower != "done"):
+            get_console().print("[yellow]No todos found.[/yellow]")
         return
     
-    # Check if first argument is a known command
-    first_arg = args[0].lower()
+    # Check if first argument is a known command (case-sensitive, as in Typer)
+    first_arg = args[0]
     if first_arg in KNOWN_COMMANDS:
+        # Simple invocations skip Typer's parsing entirely
+        fast_command = FAST_COMMANDS.get(first_arg)
+        if fast_command is not None and _run_fast_command(fast_command, args[1:]):
+            return
+        
         # Let Typer handle the command
-        app()
+        _app()()
         return
     
     # If we get here, it means an unknown command was provided
     # Show help or error message
-    console.print(f"[red]Error:[/red] Unknown command '{first_arg}'. Use 'tcli add <title>' to create a todo or 'tcli list' to list todos.")
-    console.print("Run 'tcli --help' for more information.")
+    get_console().print(f"[red]Error:[/red] Unknown command '{first_arg}'. Use 'tcli add <title>' to create a todo or 'tcli list' to list todos.")
+    get_console().print("Run 'tcli --help' for more information.")
     sys.exit(1)
 
 
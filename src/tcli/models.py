@@ -1,58 +1,74 @@
-"""Pydantic models matching the OpenAPI schema."""
+"""msgspec models matching the OpenAPI schema."""
 
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import msgspec
 
+# Field types shared by the schemas; constraints are enforced when decoding
+Title = Annotated[str, msgspec.Meta(description="The title of the todo item")]
+Description = Annotated[str, msgspec.Meta(description="Detailed description of the todo")]
+DueAt = Annotated[datetime, msgspec.Meta(description="Due date and time for the todo")]
+EstimatedMinutes = Annotated[
+    int, msgspec.Meta(ge=0, description="Estimated time to complete in minutes")
+]
+Priority = Annotated[
+    int, msgspec.Meta(ge=1, le=5, description="Priority level (1=highest, 5=lowest)")
+]
+Tags = Annotated[list[str], msgspec.Meta(description="List of tags for categorizing the todo")]
+Status = Annotated[
+    str, msgspec.Meta(description="Status of the todo (e.g., 'todo', 'in_progress', 'done')")
+]
 
-class TodoCreate(BaseModel):
+
+class TodoCreate(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Schema for creating a new todo item."""
 
-    title: str = Field(..., description="The title of the todo item")
-    description: Optional[str] = Field(None, description="Detailed description of the todo")
-    due_at: Optional[datetime] = Field(None, description="Due date and time for the todo")
-    estimated_minutes: Optional[int] = Field(
-        None, ge=0, description="Estimated time to complete in minutes"
-    )
-    priority: int = Field(
-        default=3, ge=1, le=5, description="Priority level (1=highest, 5=lowest)"
-    )
-    tags: Optional[list[str]] = Field(None, description="List of tags for categorizing the todo")
+    title: Title
+    description: Optional[Description] = None
+    due_at: Optional[DueAt] = None
+    estimated_minutes: Optional[EstimatedMinutes] = None
+    # None (omitted) lets the API apply its default of 3; callers normally set it
+    priority: Optional[Priority] = None
+    tags: Optional[Tags] = None
 
 
-class TodoUpdate(BaseModel):
+class TodoUpdate(msgspec.Struct, kw_only=True, omit_defaults=True):
     """Schema for updating a todo item. All fields are optional."""
 
-    title: Optional[str] = Field(None, description="The title of the todo item")
-    description: Optional[str] = Field(None, description="Detailed description of the todo")
-    due_at: Optional[datetime] = Field(None, description="Due date and time for the todo")
-    estimated_minutes: Optional[int] = Field(
-        None, ge=0, description="Estimated time to complete in minutes"
-    )
-    status: Optional[str] = Field(None, description="Status of the todo (e.g., 'todo', 'in_progress', 'done')")
-    priority: Optional[int] = Field(
-        None, ge=1, le=5, description="Priority level (1=highest, 5=lowest)"
-    )
-    tags: Optional[list[str]] = Field(None, description="List of tags for categorizing the todo")
+    title: Optional[Title] = None
+    description: Optional[Description] = None
+    due_at: Optional[DueAt] = None
+    estimated_minutes: Optional[EstimatedMinutes] = None
+    status: Optional[Status] = None
+    priority: Optional[Priority] = None
+    tags: Optional[Tags] = None
 
 
-class TodoRead(BaseModel):
+class TodoRead(msgspec.Struct, kw_only=True, dict=True):
     """Schema for reading a todo item with all fields including metadata."""
 
-    id: UUID = Field(..., description="Unique identifier for the todo item")
-    title: str = Field(..., description="The title of the todo item")
-    description: Optional[str] = Field(None, description="Detailed description of the todo")
-    due_at: Optional[datetime] = Field(None, description="Due date and time for the todo")
-    estimated_minutes: Optional[int] = Field(
-        None, ge=0, description="Estimated time to complete in minutes"
-    )
-    priority: int = Field(
-        default=3, ge=1, le=5, description="Priority level (1=highest, 5=lowest)"
-    )
-    tags: Optional[list[str]] = Field(None, description="List of tags for categorizing the todo")
-    status: Optional[str] = Field(None, description="Status of the todo (e.g., 'todo', 'in_progress', 'done')")
-    created_at: datetime = Field(..., description="Timestamp when the todo was created")
-    updated_at: Optional[datetime] = Field(None, description="Timestamp when the todo was last updated")
+    id: Annotated[UUID, msgspec.Meta(description="Unique identifier for the todo item")]
+    title: Title
+    description: Optional[Description] = None
+    due_at: Optional[DueAt] = None
+    estimated_minutes: Optional[EstimatedMinutes] = None
+    priority: Priority = 3
+    tags: Optional[Tags] = None
+    status: Optional[Status] = None
+    created_at: Annotated[datetime, msgspec.Meta(description="Timestamp when the todo was created")]
+    updated_at: Optional[
+        Annotated[datetime, msgspec.Meta(description="Timestamp when the todo was last updated")]
+    ] = None
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, computed once per instance for case-insensitive matching."""
+        return self.title.lower()
 
+    @cached_property
+    def status_lower(self) -> str:
+        """Lowercased status ('' if unset) for comparisons; status keeps the server's spelling."""
+        return (self.status or "").lower()
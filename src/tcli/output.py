@@ -1,52 +1,77 @@
 """Output formatting for tCLI."""
 
-import json
+import sys
 from datetime import datetime
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
-from rich.console import Console
+import msgspec
 from rich.table import Table
 from rich.text import Text
 
+from tcli._console import get_console
+from tcli._fastpath import _parse_iso
 from tcli.models import TodoRead
 
-console = Console()
+# Bound once so formatting a table cell skips the attribute lookup
+_strftime = datetime.strftime
+
+# One reusable encoder for --json output; msgspec handles UUIDs and datetimes in C
+_JSON_ENCODER = msgspec.json.Encoder()
+_format_json = msgspec.json.format
+
+# Titles longer than this are cut in the table and end with a single-char ellipsis
+_TRUNC = 30
+_ELL = "…"
+
+# Prebuilt cells for the common priorities and statuses; rich only reads these
+# when rendering, so one shared instance per value is safe
+_PRIORITY_TEXT = {
+    None: Text("—", style="dim"),
+    1: Text("1", style="bold red"),
+    2: Text("2", style="bold red"),
+    3: Text("3", style="yellow"),
+    4: Text("4", style="green"),
+    5: Text("5", style="green"),
+}
+_STATUS_TEXT = {
+    None: Text("—", style="dim"),
+    "": Text("—", style="dim"),
+    "todo": Text("todo", style="cyan"),
+    "in_progress": Text("in_progress", style="bold yellow"),
+    "done": Text("done", style="bold green"),
+}
 
 
 def format_datetime(dt: Optional[Union[str, datetime]]) -> str:
     """Format datetime string or datetime object for display."""
+    # Models carry datetime objects, so check for them first
+    if isinstance(dt, datetime):
+        return _strftime(dt, "%Y-%m-%d %H:%M")
     if not dt:
         return "—"
     
-    # If it's already a datetime object, format it directly
-    if isinstance(dt, datetime):
-        return dt.strftime("%Y-%m-%d %H:%M")
-    
     # Otherwise, parse the string
     try:
-        dt_str = str(dt)
-        dt_obj = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-        return dt_obj.strftime("%Y-%m-%d %H:%M")
+        return _strftime(_parse_iso(str(dt)), "%Y-%m-%d %H:%M")
     except Exception:
         return str(dt)
 
 
 def format_priority(priority: Optional[int]) -> Text:
     """Format priority with color coding."""
-    if priority is None:
-        return Text("—", style="dim")
-    if priority <= 2:
-        return Text(str(priority), style="bold red")
-    elif priority == 3:
-        return Text(str(priority), style="yellow")
-    else:
-        return Text(str(priority), style="green")
+    # Unset and 1-5 (the only values TodoRead allows) are all prebuilt
+    text = _PRIORITY_TEXT.get(priority)
+    if text is not None:
+        return text
+    return Text(str(priority), style="green")
 
 
 def format_status(status: Optional[str]) -> Text:
     """Format status with color coding."""
-    if not status:
-        return Text("—", style="dim")
+    # Unset, empty and the canonical lowercase statuses are prebuilt
+    text = _STATUS_TEXT.get(status)
+    if text is not None:
+        return text
     status_lower = status.lower()
     if status_lower == "done":
         return Text(status, style="bold green")
@@ -63,8 +88,13 @@ def format_tags(tags: Optional[list[str]]) -> str:
     return ", ".join(tags)
 
 
-def print_todo_table(todos: list[TodoRead]) -> None:
-    """Print todos in a table format."""
+def print_todo_table(todos: Iterable[TodoRead]) -> int:
+    """
+    Print todos in a table format.
+    
+    Rows are added as the iterable is consumed, so a generator can be passed
+    directly. Returns the number of todos printed; nothing is printed if none.
+    """
     table = Table(title="Todos", show_header=True, header_style="bold magenta")
     table.add_column("ID", style="dim", width=36)
     table.add_column("Title", style="bold", width=30)
@@ -73,25 +103,30 @@ def print_todo_table(todos: list[TodoRead]) -> None:
     table.add_column("Due Date", width=16)
     table.add_column("Tags", width=20)
 
-    for todo in todos:
-        # Extract status if it exists in the model (it might be in the response but not in schema)
-        status = getattr(todo, "status", None)
-        table.add_row(
-            str(todo.id),
-            todo.title[:30] + "..." if len(todo.title) > 30 else todo.title,
-            format_status(status),
+    # Plain cells are wrapped in Text so rich never runs its markup parser on them
+    count = 0
+    add_row = table.add_row
+    for count, todo in enumerate(todos, 1):
+        title = todo.title
+        add_row(
+            Text(str(todo.id)),
+            # A non-empty slice past the limit means the title needs cutting
+            Text(title[:_TRUNC] + _ELL if title[_TRUNC:_TRUNC + 1] else title),
+            format_status(todo.status),
             format_priority(todo.priority),
-            format_datetime(todo.due_at),
-            format_tags(todo.tags),
+            Text(format_datetime(todo.due_at)),
+            Text(format_tags(todo.tags)),
         )
 
-    console.print(table)
+    if count:
+        # rich renders the whole table before writing it out, including on
+        # legacy Windows consoles that need win32 calls instead of ANSI codes
+        get_console().print(table)
+    return count
 
 
 def print_todo_detail(todo: TodoRead) -> None:
     """Print a single todo in detailed format."""
-    status = getattr(todo, "status", None)
-
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Field", style="bold cyan", width=20)
     table.add_column("Value", width=60)
@@ -100,7 +135,7 @@ def print_todo_detail(todo: TodoRead) -> None:
     table.add_row("Title", todo.title)
     if todo.description:
         table.add_row("Description", todo.description)
-    table.add_row("Status", format_status(status))
+    table.add_row("Status", format_status(todo.status))
     table.add_row("Priority", format_priority(todo.priority))
     if todo.due_at:
         table.add_row("Due Date", format_datetime(todo.due_at))
@@ -112,17 +147,25 @@ def print_todo_detail(todo: TodoRead) -> None:
     if todo.updated_at:
         table.add_row("Updated At", format_datetime(todo.updated_at))
 
-    console.print(table)
+    get_console().print(table)
 
 
 def print_json(data: list[TodoRead] | TodoRead | dict) -> None:
-    """Print data as JSON."""
-    if isinstance(data, list):
-        json_data = [item.model_dump(mode="json") for item in data]
-    elif isinstance(data, TodoRead):
-        json_data = data.model_dump(mode="json")
+    """
+    Print data as JSON.
+
+    List items are encoded and written one at a time, so the whole document
+    is never held in memory; the bytes match formatting the list in one go.
+    """
+    sys.stdout.flush()
+    write = sys.stdout.buffer.write
+    if isinstance(data, list) and data:
+        separator = b"[\n  "
+        for item in data:
+            write(separator)
+            write(_format_json(_JSON_ENCODER.encode(item), indent=2).replace(b"\n", b"\n  "))
+            separator = b",\n  "
+        write(b"\n]\n")
     else:
-        json_data = data
-
-    print(json.dumps(json_data, indent=2, default=str))
-
+        write(_format_json(_JSON_ENCODER.encode(data), indent=2) + b"\n")
+    sys.stdout.buffer.flush()
@@ -9,13 +9,15 @@ a = Analysis(
     datas=[],
     hiddenimports=[
         'tcli',
+        'tcli._console',
+        'tcli._fastpath',
         'tcli.api',
         'tcli.config',
         'tcli.models',
         'tcli.output',
         'typer',
         'httpx',
-        'pydantic',
+        'msgspec',
         'yaml',
         'rich',
         'rich.console',
@@ -25,6 +27,8 @@ a = Analysis(
         'httpx._client',
         'httpx._transports',
         'httpx._models',
+        'h2',
+        'rapidfuzz',
     ],
     hookspath=[],
     hooksconfig={},